@@ -14,14 +14,14 @@ Base58 encoding of public keys and scripts as addresses,
 private keys as WIFs
 """
 
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from btclib import b32
 from btclib.alias import Octets, String
 from btclib.base58 import b58decode, b58encode
 from btclib.exceptions import BTClibValueError
 from btclib.hashes import hash160_from_key
-from btclib.network import NETWORKS, network_from_key_value
+from btclib.network import NETWORKS, _first_network_from_value
 from btclib.script.script import serialize
 from btclib.to_prv_key import PrvKey, prv_keyinfo_from_prv_key
 from btclib.to_pub_key import Key
@@ -34,12 +34,13 @@ def wif_from_prv_key(
     "Return the WIF encoding of a private key."
 
     q, net, compr = prv_keyinfo_from_prv_key(prv_key, network, compressed)
-    ec = NETWORKS[net].curve
+    # single dict lookup for both the curve and the wif prefix
+    network_ = NETWORKS[net]
 
     payload = b"".join(
         [
-            NETWORKS[net].wif,
-            q.to_bytes(ec.n_size, byteorder="big", signed=False),
+            network_.wif,
+            q.to_bytes(network_.curve.n_size, byteorder="big", signed=False),
             b"\x01" if compr else b"",
         ]
     )
@@ -66,23 +67,31 @@ def address_from_h160(script_type: str, h160: Octets, network: str = "mainnet")
     return b58encode(payload).decode("ascii")
 
 
+# address prefix byte -> (script_type, network)
+_ADDRESS_PREFIXES: Dict[int, Tuple[str, str]] = {
+    prefix: (script_type, network)
+    # p2pkh last, so that it would win on a shared prefix
+    for script_type in ("p2sh", "p2pkh")
+    for prefix, network in _first_network_from_value(
+        (getattr(net, script_type)[0], name) for name, net in NETWORKS.items()
+    ).items()
+}
+
+
 def h160_from_address(b58addr: String) -> Tuple[str, bytes, str]:
     "Return the payload from a base58 address."
 
     if isinstance(b58addr, str):
         b58addr = b58addr.strip()
     payload = b58decode(b58addr, 21)
-    prefix = payload[:1]
 
-    for script_type in ("p2pkh", "p2sh"):
-        # with pytohn>=3.8 use walrus operator
-        # if network := network_from_key_value(script_type, prefix):
-        network = network_from_key_value(script_type, prefix)
-        if network:
-            return script_type, payload[1:], network
+    try:
+        script_type, network = _ADDRESS_PREFIXES[payload[0]]
+    except KeyError as e:
+        err_msg = f"invalid base58 address prefix: 0x{payload[:1].hex()}"
+        raise BTClibValueError(err_msg) from e
 
-    err_msg = f"invalid base58 address prefix: 0x{prefix.hex()}"
-    raise BTClibValueError(err_msg)
+    return script_type, payload[1:], network
 
 
 # 1.+2. = 3. base58 address from pub_key/script_pub_key
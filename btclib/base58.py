@@ -44,16 +44,53 @@ from btclib.utils import bytes_from_octets, hash256
 
 _ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 __BASE = len(_ALPHABET)
+# big int arithmetic is done on limbs of _LIMB_SIZE base58 digits,
+# i.e. one big int division (or multiplication) every _LIMB_SIZE digits;
+# 58^10 < 2^60 fits a single machine word
+_LIMB_SIZE = 10
+_LIMB = __BASE ** _LIMB_SIZE
+# all the 58^2 two-digit encodings: a full limb is encoded
+# with five table lookups, instead of ten single-digit divisions
+_PAIR = __BASE * __BASE
+_ENCODED_PAIRS = tuple(bytes([a, b]) for a in _ALPHABET for b in _ALPHABET)
+# character -> digit value (0xFF for characters not in the alphabet)
+_DECODING_TABLE = bytes(
+    _ALPHABET.index(x) if x in _ALPHABET else 0xFF for x in range(256)
+)
 
 
 def _b58encode_from_int(i: int) -> bytes:
 
-    result = b""
-    while i or len(result) == 0:
+    # least significant limb first
+    limbs = []
+    while i >= _LIMB:
+        i, limb = divmod(i, _LIMB)
+        limb, p0 = divmod(limb, _PAIR)
+        limb, p1 = divmod(limb, _PAIR)
+        limb, p2 = divmod(limb, _PAIR)
+        p4, p3 = divmod(limb, _PAIR)
+        limbs.append(
+            b"".join(
+                [
+                    _ENCODED_PAIRS[p4],
+                    _ENCODED_PAIRS[p3],
+                    _ENCODED_PAIRS[p2],
+                    _ENCODED_PAIRS[p1],
+                    _ENCODED_PAIRS[p0],
+                ]
+            )
+        )
+
+    # the most significant (partial) limb, without leading zero digits
+    digits = bytearray()
+    while i or not (digits or limbs):
         i, idx = divmod(i, __BASE)
-        result = _ALPHABET[idx : idx + 1] + result
+        digits.append(_ALPHABET[idx])
+    digits.reverse()
+    limbs.append(bytes(digits))
 
-    return result
+    limbs.reverse()
+    return b"".join(limbs)
 
 
 def _b58encode(v: bytes) -> bytes:
@@ -83,16 +120,27 @@ def b58encode(v: Octets, in_size: Optional[int] = None) -> bytes:
 
 def _b58decode_to_int(v: bytes) -> int:
 
+    # map each character to its digit value in a single C-level pass
+    digits = v.translate(_DECODING_TABLE)
+
     i = 0
-    for char in v:
-        i *= __BASE
-        i += _ALPHABET.index(char)
+    # the first limb can be shorter than _LIMB_SIZE
+    start = 0
+    end = len(digits) % _LIMB_SIZE or _LIMB_SIZE
+    while start < len(digits):
+        limb = 0
+        for digit in digits[start:end]:
+            limb = limb * __BASE + digit
+        # i is still zero when the (possibly shorter) first limb is added
+        i = i * _LIMB + limb
+        start, end = end, end + _LIMB_SIZE
     return i
 
 
 def _b58decode(v: bytes) -> bytes:
 
-    if any(x not in _ALPHABET for x in v):
+    # deleting all alphabet characters must leave nothing
+    if not isinstance(v, (bytes, bytearray)) or v.translate(None, _ALPHABET):
         msg = "Base58 string contains invalid characters"
         raise BTClibValueError(msg)
 
@@ -33,13 +33,16 @@ A BIP32 extended key is 78 bytes:
 """
 
 import copy
+import functools
 import hmac
+import struct
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Type, TypeVar, Union
 
 from btclib import base58
 from btclib.alias import INF, BinaryData, Octets, Point, String
 from btclib.bip32.der_path import BIP32DerPath, indexes_from_bip32_path
+from btclib.ecc import libsecp256k1
 from btclib.ecc.curve import mult, secp256k1
 from btclib.ecc.sec_point import bytes_from_point, point_from_octets
 from btclib.exceptions import BTClibValueError
@@ -57,10 +60,27 @@ _KEY_SIZE: List[Tuple[str, int]] = [
     ("key", 33),
 ]
 _REQUIRED_LENGHT = 78
+# version, depth, parent_fingerprint, index, chain_code, key
+_BIP32_STRUCT = struct.Struct(">4sB4sI32s33s")
+_pack_index = struct.Struct(">I").pack
+# O(1) version lookups
+_XPRV_VERSIONS = frozenset(XPRV_VERSIONS_ALL)
+_XPUB_VERSIONS = frozenset(XPUB_VERSIONS_ALL)
+_XPRV_TO_XPUB = dict(zip(XPRV_VERSIONS_ALL, XPUB_VERSIONS_ALL))
 
 
 @dataclass
 class BIP32KeyData:
+    # no per-instance __dict__: less memory and faster attribute access
+    __slots__ = (
+        "version",
+        "depth",
+        "parent_fingerprint",
+        "index",
+        "chain_code",
+        "key",
+    )
+
     version: bytes
     depth: int
     parent_fingerprint: bytes
@@ -72,6 +92,17 @@ class BIP32KeyData:
     def is_hardened(self) -> bool:
         return self.index >= 0x80000000
 
+    def __copy__(self: _BIP32KeyData) -> _BIP32KeyData:
+        # plain field copy: no __reduce_ex__ machinery, no validation
+        xkey = object.__new__(type(self))
+        xkey.version = self.version
+        xkey.depth = self.depth
+        xkey.parent_fingerprint = self.parent_fingerprint
+        xkey.index = self.index
+        xkey.chain_code = self.chain_code
+        xkey.key = self.key
+        return xkey
+
     def __init__(
         self,
         version: Octets,
@@ -95,6 +126,12 @@ class BIP32KeyData:
 
     def assert_valid(self) -> None:
 
+        self._assert_valid_structure()
+        self._assert_valid_key()
+
+    def _assert_valid_structure(self) -> None:
+        "Assert the validity of everything but the key value (cheap checks)."
+
         for key, size in _KEY_SIZE:
             value = bytes(getattr(self, key))
             setattr(self, key, value)
@@ -119,42 +156,46 @@ class BIP32KeyData:
             if self.index != 0:
                 raise BTClibValueError(f"zero depth with non-zero index: {self.index}")
 
-        if self.version in XPRV_VERSIONS_ALL:
+        if self.version in _XPRV_VERSIONS:
             if self.key[0] != 0:
                 raise BTClibValueError(
                     f"invalid private key prefix: 0x{self.key[:1].hex()}"
                 )
-            q = int.from_bytes(self.key[1:], byteorder="big", signed=False)
-            if not 0 < q < ec.n:
-                raise BTClibValueError(f"invalid private key not in 1..n-1: {hex(q)}")
-        elif self.version in XPUB_VERSIONS_ALL:
+        elif self.version in _XPUB_VERSIONS:
             if self.key[0] not in (2, 3):
                 err_msg = f"invalid public key prefix not in (0x02, 0x03): 0x{self.key[:1].hex()}"
                 raise BTClibValueError(err_msg)
+        else:
+            raise BTClibValueError(
+                f"unknown extended key version: 0x{self.version.hex()}"
+            )
+
+    def _assert_valid_key(self) -> None:
+        "Assert the validity of the key value (expensive for public keys)."
+
+        if self.key[0] == 0:
+            q = int.from_bytes(self.key[1:], byteorder="big", signed=False)
+            if not 0 < q < ec.n:
+                raise BTClibValueError(f"invalid private key not in 1..n-1: {hex(q)}")
+        else:
             try:
                 ec.y(int.from_bytes(self.key[1:], byteorder="big", signed=False))
             except BTClibValueError as e:
                 err_msg = f"invalid public key: 0x{self.key.hex()}"
                 raise BTClibValueError(err_msg) from e
-        else:
-            raise BTClibValueError(
-                f"unknown extended key version: 0x{self.version.hex()}"
-            )
 
     def serialize(self, check_validity: bool = True) -> bytes:
 
         if check_validity:
             self.assert_valid()
 
-        return b"".join(
-            [
-                self.version,
-                self.depth.to_bytes(1, byteorder="big", signed=False),
-                self.parent_fingerprint,
-                self.index.to_bytes(4, byteorder="big", signed=False),
-                self.chain_code,
-                self.key,
-            ]
+        return _BIP32_STRUCT.pack(
+            self.version,
+            self.depth,
+            self.parent_fingerprint,
+            self.index,
+            self.chain_code,
+            self.key,
         )
 
     def b58encode(self, check_validity: bool = True) -> str:
@@ -165,23 +206,26 @@ class BIP32KeyData:
     def parse(
         cls: Type[_BIP32KeyData], xkey_bin: BinaryData, check_validity: bool = True
     ) -> _BIP32KeyData:
-        "Return a BIP32KeyData by parsing 73 bytes from binary data."
+        "Return a BIP32KeyData by parsing 78 bytes from binary data."
 
         stream = bytesio_from_binarydata(xkey_bin)
         xkey_bin = stream.read(_REQUIRED_LENGHT)
 
-        if check_validity and len(xkey_bin) != _REQUIRED_LENGHT:
+        if len(xkey_bin) != _REQUIRED_LENGHT:
             err_msg = f"invalid decoded length: {len(xkey_bin)}"
             err_msg += f" instead of {_REQUIRED_LENGHT}"
             raise BTClibValueError(err_msg)
 
+        # the struct returns the fields already typed and sized
+        fields = _BIP32_STRUCT.unpack(xkey_bin)
+        version, depth, parent_fingerprint, index, chain_code, key = fields
         return cls(
-            version=xkey_bin[0:4],
-            depth=xkey_bin[4],
-            parent_fingerprint=xkey_bin[5:9],
-            index=int.from_bytes(xkey_bin[9:13], byteorder="big", signed=False),
-            chain_code=xkey_bin[13:45],
-            key=xkey_bin[45:78],
+            version=version,
+            depth=depth,
+            parent_fingerprint=parent_fingerprint,
+            index=index,
+            chain_code=chain_code,
+            key=key,
             check_validity=check_validity,
         )
 
@@ -238,6 +282,14 @@ def rootxprv_from_seed(
 BIP32Key = Union[BIP32KeyData, String]
 
 
+def _pub_key_from_prv_key_int(q: int) -> bytes:
+    "Return the compressed public key of q, using libsecp256k1 if available."
+
+    if libsecp256k1.LIBSECP256K1_AVAILABLE:
+        return libsecp256k1.pub_key_from_prv_key(q)
+    return bytes_from_point(mult(q))
+
+
 def _xpub_from_xprv(xprv: BIP32Key) -> BIP32KeyData:
     """Neutered Derivation (ND).
 
@@ -247,6 +299,7 @@ def _xpub_from_xprv(xprv: BIP32Key) -> BIP32KeyData:
 
     if isinstance(xprv, BIP32KeyData):
         xkey = copy.copy(xprv)
+        xkey.assert_valid()
     else:
         xkey = BIP32KeyData.b58decode(xprv)
 
@@ -254,12 +307,10 @@ def _xpub_from_xprv(xprv: BIP32Key) -> BIP32KeyData:
         err_msg = f"not a private key: {xkey.b58encode()}"
         raise BTClibValueError(err_msg)
 
-    i = XPRV_VERSIONS_ALL.index(xkey.version)
-    xkey.version = XPUB_VERSIONS_ALL[i]
+    xkey.version = _XPRV_TO_XPUB[xkey.version]
 
     q = int.from_bytes(xkey.key[1:], byteorder="big", signed=False)
-    Q = mult(q)
-    xkey.key = bytes_from_point(Q)
+    xkey.key = _pub_key_from_prv_key_int(q)
 
     return xkey
 
@@ -271,15 +322,17 @@ def xpub_from_xprv(xprv: BIP32Key) -> str:
     private key (“neutered” as it removes the ability to sign transactions).
     """
     xkey = _xpub_from_xprv(xprv)
-    return xkey.b58encode()
+    # valid by construction: skip the expensive public key check
+    return xkey.b58encode(check_validity=False)
 
 
 @dataclass
 class _ExtendedBIP32KeyData(BIP32KeyData):
+    __slots__ = ("prv_key_int", "_pub_key_point")
+
     # extensions used to cache intermediate results
     # in multi-level derivation: do not rely on them elsewhere
     prv_key_int: int  # non-zero for private key only
-    pub_key_point: Point  # non-Infinity for public key only
 
     def __init__(
         self,
@@ -300,34 +353,56 @@ class _ExtendedBIP32KeyData(BIP32KeyData):
         self.prv_key_int = (
             int.from_bytes(self.key[1:], "big", signed=False) if is_prv else 0
         )
-        self.pub_key_point = INF if is_prv else point_from_octets(self.key, ec)
+        # lazily computed by pub_key_point; not a dataclass field,
+        # so that __eq__ and __repr__ do not depend on it
+        self._pub_key_point: Optional[Point] = None
 
         if check_validity:
             self.assert_valid()
 
+    @property
+    def pub_key_point(self) -> Point:
+        "Return the public key point (INF for private keys)."
+
+        # lazily computed, as the point_from_octets square root
+        # is needed only for public derivation
+        if self._pub_key_point is None:
+            is_prv = self.key[0] == 0
+            self._pub_key_point = INF if is_prv else point_from_octets(self.key, ec)
+        return self._pub_key_point
+
+    @pub_key_point.setter
+    def pub_key_point(self, value: Point) -> None:
+        self._pub_key_point = value
+
+    def __copy__(self) -> "_ExtendedBIP32KeyData":
+        xkey = super().__copy__()
+        xkey.prv_key_int = self.prv_key_int
+        xkey._pub_key_point = self._pub_key_point
+        return xkey
+
 
 def __ckd(xkey: _ExtendedBIP32KeyData, index: int) -> None:
 
     xkey.depth += 1
     xkey.index = index
+    try:
+        index_bytes = _pack_index(index)
+    except struct.error as e:
+        # same error as int.to_bytes(4, "big", signed=False)
+        raise OverflowError(f"int too big to convert: {index}") from e
     if xkey.key[0] == 0:  # private key
-        Q_bytes = bytes_from_point(mult(xkey.prv_key_int))
+        Q_bytes = _pub_key_from_prv_key_int(xkey.prv_key_int)
         xkey.parent_fingerprint = hash160(Q_bytes)[:4]
         if xkey.is_hardened():  # hardened derivation
-            hmac_ = hmac.new(
-                xkey.chain_code,
-                xkey.key + index.to_bytes(4, byteorder="big", signed=False),
-                "sha512",
-            ).digest()
+            hmac_ = hmac.new(xkey.chain_code, xkey.key + index_bytes, "sha512").digest()
         else:  # normal derivation
-            hmac_ = hmac.new(
-                xkey.chain_code,
-                Q_bytes + index.to_bytes(4, byteorder="big", signed=False),
-                "sha512",
-            ).digest()
+            hmac_ = hmac.new(xkey.chain_code, Q_bytes + index_bytes, "sha512").digest()
         xkey.chain_code = hmac_[32:]
         offset = int.from_bytes(hmac_[:32], byteorder="big", signed=False)
         xkey.prv_key_int = (xkey.prv_key_int + offset) % ec.n
+        if xkey.prv_key_int == 0:  # pragma: no cover
+            raise BTClibValueError("invalid derived private key: zero")
         xkey.key = b"\x00" + xkey.prv_key_int.to_bytes(
             32, byteorder="big", signed=False
         )
@@ -336,11 +411,7 @@ def __ckd(xkey: _ExtendedBIP32KeyData, index: int) -> None:
         xkey.parent_fingerprint = hash160(xkey.key)[:4]
         if xkey.is_hardened():
             raise BTClibValueError("invalid hardened derivation from public key")
-        hmac_ = hmac.new(
-            xkey.chain_code,
-            xkey.key + index.to_bytes(4, byteorder="big", signed=False),
-            "sha512",
-        ).digest()
+        hmac_ = hmac.new(xkey.chain_code, xkey.key + index_bytes, "sha512").digest()
         xkey.chain_code = hmac_[32:]
         offset = int.from_bytes(hmac_[:32], byteorder="big", signed=False)
         xkey.pub_key_point = ec.add(xkey.pub_key_point, mult(offset))
@@ -348,12 +419,42 @@ def __ckd(xkey: _ExtendedBIP32KeyData, index: int) -> None:
         xkey.prv_key_int = 0
 
 
+def _derive_prefix(xkey_bin: bytes, indexes: Tuple[int, ...]) -> _ExtendedBIP32KeyData:
+    """Return the extended key derived from xkey_bin along indexes.
+
+    xkey_bin must have already been validated.
+    """
+
+    xkey = _ExtendedBIP32KeyData.parse(xkey_bin, check_validity=False)
+    for index in indexes:
+        __ckd(xkey, index)
+    return xkey
+
+
+# only public derivations are cached: private keys must not be kept alive
+# in a module-level cache for the whole process lifetime.
+# The cached results must be copied before any modification.
+_derive_pub_prefix = functools.lru_cache(maxsize=1024)(_derive_prefix)
+
+
+def clear_derive_cache() -> None:
+    "Clear the cache of intermediate public derivation results."
+    _derive_pub_prefix.cache_clear()
+
+
 def _derive(
-    xkey: BIP32Key, der_path: BIP32DerPath, forced_version: Optional[Octets] = None
+    xkey: BIP32Key,
+    der_path: BIP32DerPath,
+    forced_version: Optional[Octets] = None,
+    check_validity: bool = True,
 ) -> BIP32KeyData:
 
-    if not isinstance(xkey, BIP32KeyData):
+    if isinstance(xkey, BIP32KeyData):
+        xkey_bin = xkey.serialize(check_validity)
+    else:
         xkey = BIP32KeyData.b58decode(xkey)
+        # just validated by b58decode
+        xkey_bin = xkey.serialize(check_validity=False)
 
     indexes = indexes_from_bip32_path(der_path)
 
@@ -362,22 +463,20 @@ def _derive(
         err_msg = f"final depth greater than 255: {final_depth}"
         raise BTClibValueError(err_msg)
 
-    xkey = _ExtendedBIP32KeyData(
-        version=xkey.version,
-        depth=xkey.depth,
-        parent_fingerprint=xkey.parent_fingerprint,
-        index=xkey.index,
-        chain_code=xkey.chain_code,
-        key=xkey.key,
-    )
-    for index in indexes:
-        __ckd(xkey, index)
+    if xkey.key[0] == 0:  # private key: never cached
+        xkey = _derive_prefix(xkey_bin, tuple(indexes[:-1]))
+    else:
+        # the public derivation up to the last index is cached, as wallets
+        # usually derive many addresses sharing the same xpub path prefix
+        xkey = copy.copy(_derive_pub_prefix(xkey_bin, tuple(indexes[:-1])))
+    if indexes:
+        __ckd(xkey, indexes[-1])
 
     if forced_version:
-        if xkey.version in XPRV_VERSIONS_ALL:
-            allowed_versions = XPRV_VERSIONS_ALL
+        if xkey.version in _XPRV_VERSIONS:
+            allowed_versions = _XPRV_VERSIONS
         else:
-            allowed_versions = XPUB_VERSIONS_ALL
+            allowed_versions = _XPUB_VERSIONS
         fversion = bytes_from_octets(forced_version, 4)
         if fversion not in allowed_versions:
             err_msg = "invalid version forced on the extended key"
@@ -404,7 +503,8 @@ def derive(
     (e.g. "M /44h / 0' /1H // 0/ 10 / ").
     """
     xkey = _derive(xkey, der_path, forced_version)
-    return xkey.b58encode()
+    # valid by construction: skip the expensive public key check
+    return xkey.b58encode(check_validity=False)
 
 
 def _derive_from_account(
@@ -415,7 +515,9 @@ def _derive_from_account(
     max_index: int = 0xFFFF,
 ) -> BIP32KeyData:
 
-    if not isinstance(xkey, BIP32KeyData):
+    if isinstance(xkey, BIP32KeyData):
+        xkey.assert_valid()
+    else:
         xkey = BIP32KeyData.b58decode(xkey)
 
     if not xkey.is_hardened():
@@ -433,7 +535,8 @@ def _derive_from_account(
     if address_index > max_index:
         raise BTClibValueError(f"too high address index: {branch}")
 
-    return _derive(xkey, f"m/{branch}/{address_index}")
+    # just validated: skip the expensive public key check
+    return _derive(xkey, (branch, address_index), check_validity=False)
 
 
 def derive_from_account(
@@ -444,9 +547,11 @@ def derive_from_account(
     max_index: int = 0xFFFF,
 ) -> str:
 
-    return _derive_from_account(
+    xkey = _derive_from_account(
         xkey, branch, address_index, branches_0_1_only, max_index
-    ).b58encode()
+    )
+    # valid by construction: skip the expensive public key check
+    return xkey.b58encode(check_validity=False)
 
 
 def crack_prv_key(parent_xpub: BIP32Key, child_xprv: BIP32Key) -> str:
@@ -486,7 +591,7 @@ def crack_prv_key(parent_xpub: BIP32Key, child_xprv: BIP32Key) -> str:
 
     hmac_ = hmac.new(
         p.chain_code,
-        p.key + c.index.to_bytes(4, byteorder="big", signed=False),
+        p.key + _pack_index(c.index),
         "sha512",
     ).digest()
     child_q = int.from_bytes(c.key[1:], byteorder="big", signed=False)
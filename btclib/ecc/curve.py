@@ -16,6 +16,7 @@ from os import path
 from typing import Dict, List, Optional, Sequence
 
 from btclib.alias import Integer, JacPoint, Point
+from btclib.ecc import libsecp256k1
 from btclib.ecc.curve_group import (
     HEX_THRESHOLD,
     CurveGroup,
@@ -23,7 +24,9 @@ from btclib.ecc.curve_group import (
     _mult,
     _multi_mult,
     jac_from_aff,
+    mult_fixed_window_cached,
 )
+from btclib.ecc.curve_group_2 import mult_endomorphism_secp256k1
 from btclib.exceptions import BTClibValueError
 from btclib.utils import hex_string, int_from_integer
 
@@ -210,14 +213,23 @@ secp256k1 = CURVES["secp256k1"]
 
 def mult(m: Integer, Q: Optional[Point] = None, ec: Curve = secp256k1) -> Point:
     "Elliptic curve scalar multiplication."
-    if Q is None:
-        QJ = ec.GJ
-    else:
-        ec.require_on_curve(Q)
-        QJ = jac_from_aff(Q)
 
     m = int_from_integer(m) % ec.n
-    R = _mult(m, QJ, ec)
+    if Q is None or Q == ec.G:
+        if m and ec is secp256k1 and libsecp256k1.LIBSECP256K1_AVAILABLE:
+            pub_key = libsecp256k1.pub_key_from_prv_key(m, compressed=False)
+            x = int.from_bytes(pub_key[1:33], byteorder="big", signed=False)
+            y = int.from_bytes(pub_key[33:], byteorder="big", signed=False)
+            return x, y
+        # fixed-base multiplication: the generator multiples are cached
+        R = mult_fixed_window_cached(m, ec.GJ, ec)
+    else:
+        ec.require_on_curve(Q)
+        if ec is secp256k1:
+            # variable-base multiplication: GLV endomorphism
+            R = mult_endomorphism_secp256k1(m, jac_from_aff(Q), ec)
+        else:
+            R = _mult(m, jac_from_aff(Q), ec)
     return ec.aff_from_jac(R)
 
 
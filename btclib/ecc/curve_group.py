@@ -735,6 +735,26 @@ def _double_mult(
     return R
 
 
+def _double_mult_cached(
+    u: int, HJ: JacPoint, v: int, QJ: JacPoint, ec: CurveGroup
+) -> JacPoint:
+    """Double scalar multiplication (u*H + v*Q) for a fixed H point.
+
+    H is assumed to be a fixed point (e.g. the generator),
+    so that u*H is computed with cached multiples and just needs additions,
+    while v*Q is computed using "fixed window".
+
+    As it is not constant-time, it must be used
+    only with public coefficients (e.g. signature verification).
+
+    The input points are assumed to be on curve,
+    the u and v coefficients are assumed to have been reduced mod n
+    if appropriate (e.g. cyclic groups of order n).
+    """
+
+    return ec.add_jac(mult_fixed_window_cached(u, HJ, ec), _mult(v, QJ, ec))
+
+
 def _multi_mult(
     scalars: Sequence[int], jac_points: Sequence[JacPoint], ec: CurveGroup
 ) -> JacPoint:
@@ -41,13 +41,16 @@ TODO:
 """
 
 
-from math import ceil
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Tuple
 
 from btclib.alias import INFJ, JacPoint
-from btclib.ecc.curve_group import CurveGroup, _double_mult, convert_number_to_base
+from btclib.ecc.curve_group import CurveGroup, convert_number_to_base, multiples
 from btclib.exceptions import BTClibValueError
 
+if TYPE_CHECKING:  # pragma: no cover
+    # btclib.ecc.curve imports this module: no runtime import
+    from btclib.ecc.curve import Curve
+
 
 def mods(m: int, w: int) -> int:
     "Signed modulo function."
@@ -206,7 +209,7 @@ def mult_w_NAF(m: int, Q: JacPoint, ec: CurveGroup, w: int = 4) -> JacPoint:
     return R
 
 
-def multiplier_decomposer(m: int, ec: CurveGroup) -> Tuple[int, int]:
+def multiplier_decomposer(m: int, ec: "Curve") -> Tuple[int, int]:
     """Decompose m in two integers m1 e m2 so that mP = m1*P + m2*lambda*P.
 
     Used for point multiplication with efficiently computable endomorphisms.
@@ -214,31 +217,34 @@ def multiplier_decomposer(m: int, ec: CurveGroup) -> Tuple[int, int]:
     Based on alghoritm 3.74 of
     D. Hankerson, 'Guide to Elliptic Curve Cryptography'.
     Values computed for secp256k1.
+
+    m1 and m2 are signed integers of about half the bit length of n.
     """
 
     if m < 0:
         raise ValueError(f"negative m: {hex(m)}")
 
-    m %= ec.p
+    m %= ec.n
 
     # balanced length-two representation of a multiplier m.
     # values for secp256k1.
     # https://medium.com/@CoinExChain/acceleration-of-ecdsa-verification-with-endomorphism-mapping-of-secp256k1-126e77a51dba
-    a1 = 0x3086D221A7D46BCDE86C90E49284EB15 % ec.p
-    b1 = -0xE4437ED6010E88286F547FA90ABFE4C3 % ec.p
-    a2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8 % ec.p
-    b2 = 0x3086D221A7D46BCDE86C90E49284EB15 % ec.p
+    a1 = 0x3086D221A7D46BCDE86C90E49284EB15
+    b1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+    a2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+    b2 = 0x3086D221A7D46BCDE86C90E49284EB15
 
-    c1 = ceil(b2 * m / ec.p)
-    c2 = ceil((-1) * b1 * m / ec.p)
+    # integer rounding of b2*m/n and -b1*m/n: no float precision loss
+    c1 = (2 * b2 * m + ec.n) // (2 * ec.n)
+    c2 = (-2 * b1 * m + ec.n) // (2 * ec.n)
 
     m1 = m - (a1 * c1) - (a2 * c2)
     m2 = -(c1 * b1) - (c2 * b2)
 
-    return m1 % ec.p, m2 % ec.p
+    return m1, m2
 
 
-def mult_endomorphism_secp256k1(m: int, Q: JacPoint, ec: CurveGroup) -> JacPoint:
+def mult_endomorphism_secp256k1(m: int, Q: JacPoint, ec: "Curve") -> JacPoint:
     "Scalar multiplication in Jacobian coordinates using efficient endomorphism."
 
     m1, m2 = multiplier_decomposer(m, ec)
@@ -248,7 +254,28 @@ def mult_endomorphism_secp256k1(m: int, Q: JacPoint, ec: CurveGroup) -> JacPoint
     # lam = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
     beta = 0x7AE96A2B657C07106E64479EAC3434E99CF0497512F58995C1396C28719501EE
 
-    K = ((Q[0] * beta) % ec.p), Q[1], Q[2]  # K = lambda*Q, direct calculation
-
-    # FIXME: Change double mult (?) with alghoritm 3.77
-    return _double_mult(m1, Q, m2, K, ec)
+    # interleaved fixed window on the two half-length multipliers:
+    # half the doublings of a full-length fixed window multiplication
+    w = 4
+    T = multiples(Q, 2 ** w, ec)
+    # negative multipliers are applied to the opposite points
+    T1 = [ec.negate_jac(P) for P in T] if m1 < 0 else T
+    # lambda*(j*Q) = (beta*x, y, z): direct calculation, no point operation
+    T2 = [((P[0] * beta) % ec.p, P[1], P[2]) for P in T]
+    T2 = [ec.negate_jac(P) for P in T2] if m2 < 0 else T2
+
+    digits1 = convert_number_to_base(abs(m1), 2 ** w)
+    digits2 = convert_number_to_base(abs(m2), 2 ** w)
+    size = max(len(digits1), len(digits2))
+    digits1 = [0] * (size - len(digits1)) + digits1
+    digits2 = [0] * (size - len(digits2)) + digits2
+
+    R = ec.add_jac(T1[digits1[0]], T2[digits2[0]])
+    for i, j in zip(digits1[1:], digits2[1:]):
+        # multiple 'double'
+        for _ in range(w):
+            R = ec.double_jac(R)
+        # and 'add' both
+        R = ec.add_jac(R, T1[i])
+        R = ec.add_jac(R, T2[j])
+    return R
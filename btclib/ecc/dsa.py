@@ -23,8 +23,9 @@ from hashlib import sha256
 from typing import List, Optional, Tuple, Union
 
 from btclib.alias import HashF, JacPoint, Octets, Point
+from btclib.ecc import libsecp256k1
 from btclib.ecc.curve import Curve, secp256k1
-from btclib.ecc.curve_group import _double_mult, _mult
+from btclib.ecc.curve_group import _double_mult_cached, mult_fixed_window_cached
 from btclib.ecc.der import Sig
 from btclib.ecc.number_theory import mod_inv
 from btclib.ecc.rfc6979 import _rfc6979_
@@ -46,7 +47,7 @@ def gen_keys(
     else:
         q = int_from_prv_key(prv_key, ec)
 
-    QJ = _mult(q, ec.GJ, ec)
+    QJ = mult_fixed_window_cached(q, ec.GJ, ec)
     Q = ec.aff_from_jac(QJ)
     return q, Q
 
@@ -58,7 +59,7 @@ def _sign_(c: int, q: int, nonce: int, lower_s: bool, ec: Curve) -> Sig:
 
     # Steps numbering follows SEC 1 v.2 section 4.1.3
 
-    KJ = _mult(nonce, ec.GJ, ec)  # 1
+    KJ = mult_fixed_window_cached(nonce, ec.GJ, ec)  # 1
 
     # affine x_K-coordinate of K (field element)
     x_K = (KJ[0] * mod_inv(KJ[2] * KJ[2], ec.p)) % ec.p
@@ -92,6 +93,9 @@ def sign_(
 
     If the deterministic nonce is not provided,
     the RFC6979 specification is used.
+
+    For secp256k1, sha256, RFC6979 nonce, and low-s signatures,
+    libsecp256k1 is used if available.
     """
 
     # the message msg_hash: a hf_len array
@@ -102,6 +106,17 @@ def sign_(
     # SEC 1 v.2 section 3.2.1
     q = int_from_prv_key(prv_key, ec)
 
+    # libsecp256k1 uses the same RFC6979 nonce and low-s normalization
+    if (
+        nonce is None
+        and lower_s
+        and ec is secp256k1
+        and hf is sha256
+        and libsecp256k1.LIBSECP256K1_AVAILABLE
+    ):
+        r, s = libsecp256k1.ecdsa_sign_(msg_hash, q)
+        return Sig(r, s, ec)
+
     # the challenge
     c = challenge_(msg_hash, ec, hf)  # 4, 5
 
@@ -159,7 +174,7 @@ def _assert_as_valid_(
     u = c * w % ec.n
     v = r * w % ec.n  # 4
     # Let K = u*G + v*Q.
-    KJ = _double_mult(v, QJ, u, ec.GJ, ec)  # 5
+    KJ = _double_mult_cached(u, ec.GJ, v, QJ, ec)  # 5
 
     # Fail if infinite(K).
     # edge case that cannot be reproduced in the test suite
@@ -267,7 +282,7 @@ def _recover_pub_keys_(
             yodd = ec.y_even(x_K)
             KJ = x_K, yodd, 1  # 1.2, 1.3, and 1.4
             # 1.5 has been performed in the recover_pub_keys calling function
-            QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
+            QJ = _double_mult_cached(r1e, ec.GJ, r1s, KJ, ec)  # 1.6.1
             try:
                 _assert_as_valid_(c, QJ, r, s, lower_s, ec)  # 1.6.2
             except (BTClibValueError, BTClibRuntimeError):
@@ -275,7 +290,7 @@ def _recover_pub_keys_(
             else:
                 keys.append(QJ)  # 1.6.2
             KJ = x_K, ec.p - yodd, 1  # 1.6.3
-            QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)
+            QJ = _double_mult_cached(r1e, ec.GJ, r1s, KJ, ec)
             try:
                 _assert_as_valid_(c, QJ, r, s, lower_s, ec)  # 1.6.2
             except (BTClibValueError, BTClibRuntimeError):
@@ -345,7 +360,7 @@ def _recover_pub_key_(
     y_K = ec.p - y_even if i else y_even
     KJ = x_K, y_K, 1  # 1.2, 1.3, and 1.4
     # 1.5 has been performed in the recover_pub_keys calling function
-    QJ = _double_mult(r1s, KJ, r1e, ec.GJ, ec)  # 1.6.1
+    QJ = _double_mult_cached(r1e, ec.GJ, r1s, KJ, ec)  # 1.6.1
     _assert_as_valid_(c, QJ, r, s, lower_s, ec)  # 1.6.2
     return QJ
 
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"""Optional bindings to libsecp256k1.
+
+libsecp256k1 is the optimized C library used by Bitcoin Core
+for elliptic curve operations on secp256k1:
+https://github.com/bitcoin-core/secp256k1
+
+Its python bindings are provided by coincurve, an optional dependency:
+if coincurve is not available, LIBSECP256K1_AVAILABLE is False
+and the pure python implementation is used by btclib.
+
+This module intentionally does not depend on btclib.ecc.curve,
+so that it can be used by the curve module itself.
+"""
+
+from typing import Tuple
+
+from btclib.exceptions import BTClibValueError
+
+# pylint: disable=no-name-in-module
+try:
+    from coincurve._libsecp256k1 import ffi, lib  # type: ignore
+
+    GLOBAL_CTX = ffi.gc(
+        lib.secp256k1_context_create(
+            lib.SECP256K1_CONTEXT_SIGN | lib.SECP256K1_CONTEXT_VERIFY
+        ),
+        lib.secp256k1_context_destroy,
+    )
+    LIBSECP256K1_AVAILABLE = True
+except (ImportError, AttributeError):  # pragma: no cover
+    LIBSECP256K1_AVAILABLE = False
+# pylint: enable=no-name-in-module
+
+_N_SIZE = 32
+
+
+def _prv_key_from_int(q: int) -> bytes:
+
+    try:
+        return q.to_bytes(_N_SIZE, byteorder="big", signed=False)
+    except OverflowError as e:
+        raise BTClibValueError(f"private key not in 1..n-1: {hex(q)}") from e
+
+
+def pub_key_from_prv_key(q: int, compressed: bool = True) -> bytes:
+    """Return the SEC serialization of the public key q*G.
+
+    The private key q must be in the [1, n-1] range.
+    """
+
+    prv_key = _prv_key_from_int(q)
+    pub_key = ffi.new("secp256k1_pubkey *")
+    if not lib.secp256k1_ec_pubkey_create(GLOBAL_CTX, pub_key, prv_key):
+        raise BTClibValueError(f"private key not in 1..n-1: {hex(q)}")
+
+    size = 33 if compressed else 65
+    output = ffi.new(f"unsigned char[{size}]")
+    output_size = ffi.new("size_t *", size)
+    flags = lib.SECP256K1_EC_COMPRESSED if compressed else lib.SECP256K1_EC_UNCOMPRESSED
+    lib.secp256k1_ec_pubkey_serialize(GLOBAL_CTX, output, output_size, pub_key, flags)
+    return bytes(ffi.buffer(output, size))
+
+
+def rfc6979_(c: int, q: int) -> int:
+    """Return the first RFC6979 candidate nonce for the challenge c.
+
+    HMAC-SHA256 is used, without additional data:
+    the candidate nonce is not guaranteed to be in the [1, n-1] range.
+    """
+
+    prv_key = _prv_key_from_int(q)
+    msg_hash = c.to_bytes(_N_SIZE, byteorder="big", signed=False)
+
+    nonce = ffi.new("unsigned char[32]")
+    lib.secp256k1_nonce_function_rfc6979(
+        nonce, msg_hash, prv_key, ffi.NULL, ffi.NULL, 0
+    )
+    return int.from_bytes(bytes(nonce), byteorder="big", signed=False)
+
+
+def ecdsa_sign_(msg_hash: bytes, q: int) -> Tuple[int, int]:
+    """Return the (r, s) low-s ECDSA signature of a 32 bytes message hash.
+
+    The private key q must be in the [1, n-1] range.
+    The nonce is the RFC6979 deterministic one,
+    with HMAC-SHA256 and without additional data.
+    """
+
+    prv_key = _prv_key_from_int(q)
+
+    sig = ffi.new("secp256k1_ecdsa_signature *")
+    if not lib.secp256k1_ecdsa_sign(
+        GLOBAL_CTX, sig, msg_hash, prv_key, ffi.NULL, ffi.NULL
+    ):
+        raise BTClibValueError(f"private key not in 1..n-1: {hex(q)}")
+
+    output = ffi.new("unsigned char[64]")
+    lib.secp256k1_ecdsa_signature_serialize_compact(GLOBAL_CTX, output, sig)
+    r_s = bytes(ffi.buffer(output, 64))
+    return int.from_bytes(r_s[:_N_SIZE], "big"), int.from_bytes(r_s[_N_SIZE:], "big")
@@ -21,6 +21,7 @@ with the following modifications:
 * added extensive unit test
 """
 
+import sys
 from typing import Tuple
 
 from btclib.exceptions import BTClibValueError
@@ -42,17 +43,29 @@ def xgcd(a: int, b: int) -> Tuple[int, int, int]:
     return b, x0, y0
 
 
+# since python 3.8 the built-in pow supports modular inverse
+_POW_MOD_INV = sys.version_info >= (3, 8)
+
+
 def mod_inv(a: int, m: int) -> int:
     """Return the inverse of a (mod m). m does not have to be a prime.
 
     Based on Extended Euclidean Algorithm, see:
     https://en.wikibooks.org/wiki/Algorithm_Implementation/Mathematics/Extended_Euclidean_algorithm
+
+    If available (python 3.8+), the built-in pow is used instead.
     """
 
     a %= m
-    g, x, _ = xgcd(a, m)
-    if g == 1:
-        return x % m
+    if _POW_MOD_INV:
+        try:
+            return pow(a, -1, m)
+        except ValueError:
+            pass
+    else:  # pragma: no cover
+        g, x, _ = xgcd(a, m)
+        if g == 1:
+            return x % m
     err_msg = "No inverse for "
     err_msg += f"{hex_string(a)}" if a > 0xFFFFFFFF else f"{a}"
     err_msg += " mod "
@@ -39,6 +39,7 @@ import hmac
 from hashlib import sha256
 
 from btclib.alias import HashF, Octets
+from btclib.ecc import libsecp256k1
 from btclib.ecc.curve import Curve, secp256k1
 from btclib.hashes import challenge_
 from btclib.to_prv_key import PrvKey, int_from_prv_key
@@ -48,10 +49,19 @@ from btclib.utils import int_from_bits
 def _rfc6979_(c: int, q: int, ec: Curve, hf: HashF) -> int:
     # https://tools.ietf.org/html/rfc6979 section 3.2
 
+    if ec is secp256k1 and hf is sha256 and libsecp256k1.LIBSECP256K1_AVAILABLE:
+        det_nonce = libsecp256k1.rfc6979_(c, q)
+        # the first candidate is not acceptable only with negligible probability
+        if 0 < det_nonce < ec.n:
+            return det_nonce
+
+    # curve parameters bound once, as they are used in the loop
+    n, nlen, n_size = ec.n, ec.nlen, ec.n_size
+
     # convert the private key q to an octet sequence of size n_size
-    q_bytes = q.to_bytes(ec.n_size, byteorder="big", signed=False)
+    q_bytes = q.to_bytes(n_size, byteorder="big", signed=False)
     # truncate and/or expand c: encoding size is driven by n_size
-    c_bytes = c.to_bytes(ec.n_size, byteorder="big", signed=False)
+    c_bytes = c.to_bytes(n_size, byteorder="big", signed=False)
     bprvbm = q_bytes + c_bytes
 
     hf_size = hf().digest_size
@@ -64,9 +74,10 @@ def _rfc6979_(c: int, q: int, ec: Curve, hf: HashF) -> int:
     v = hmac.new(k, v, hf).digest()  # 3.2.g
 
     while True:  # 3.2.h
-        t = b""  # 3.2.h.1
-        while len(t) < ec.n_size:  # 3.2.h.2
+        t = bytearray()  # 3.2.h.1
+        while len(t) < n_size:  # 3.2.h.2
             v = hmac.new(k, v, hf).digest()
+            # extended in place, without reallocating at each step
             t += v
         # The following line would introduce a bias
         # det_nonce = int.from_bytes(t, 'big') % ec.n
@@ -77,8 +88,8 @@ def _rfc6979_(c: int, q: int, ec: Curve, hf: HashF) -> int:
         # However, if the order n is sufficiently close to 2^hf_len,
         # then the bias is not observable: e.g.
         # for secp256k1 and sha256 1-n/2^256 it is about 1.27*2^-128
-        det_nonce = int_from_bits(t, ec.nlen)  # candidate det_nonce           # 3.2.h.3
-        if 0 < det_nonce < ec.n:  # acceptable values for det_nonce
+        det_nonce = int_from_bits(t, nlen)  # candidate det_nonce           # 3.2.h.3
+        if 0 < det_nonce < n:  # acceptable values for det_nonce
             return det_nonce  # successful candidate
         k = hmac.new(k, v + b"\x00", hf).digest()
         v = hmac.new(k, v, hf).digest()
@@ -57,7 +57,11 @@ from typing import List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from btclib.alias import BinaryData, HashF, Integer, JacPoint, Octets, Point
 from btclib.bip32.bip32 import BIP32Key
 from btclib.ecc.curve import Curve, secp256k1
-from btclib.ecc.curve_group import _double_mult, _mult, _multi_mult
+from btclib.ecc.curve_group import (
+    _double_mult_cached,
+    _multi_mult,
+    mult_fixed_window_cached,
+)
 from btclib.ecc.number_theory import mod_inv
 from btclib.exceptions import BTClibRuntimeError, BTClibTypeError, BTClibValueError
 from btclib.hashes import reduce_to_hlen, tagged_hash
@@ -171,7 +175,7 @@ def gen_keys_(
     else:
         q = int_from_prv_key(prv_key, ec)
 
-    QJ = _mult(q, ec.GJ, ec)
+    QJ = mult_fixed_window_cached(q, ec.GJ, ec)
     x_Q, y_Q = ec.aff_from_jac(QJ)
     if y_Q % 2:
         q = ec.n - q
@@ -355,17 +359,18 @@ def _assert_as_valid_(c: int, QJ: JacPoint, r: int, s: int, ec: Curve) -> None:
 
     # Let K = sG - eQ.
     # in Jacobian coordinates
-    KJ = _double_mult(ec.n - c, QJ, s, ec.GJ, ec)
+    KJ = _double_mult_cached(s, ec.GJ, ec.n - c, QJ, ec)
 
     # Fail if infinite(KJ).
+    # Fail if x_K ≠ r
+    # first, as it does not require the (expensive) inversion of KJ[2]
+    if KJ[2] == 0 or KJ[0] != KJ[2] * KJ[2] * r % ec.p:
+        raise BTClibRuntimeError("signature verification failed")
+
     # Fail if y_K is odd.
     if ec.y_aff_from_jac(KJ) % 2:
         raise BTClibRuntimeError("y_K is odd")
 
-    # Fail if x_K ≠ r
-    if KJ[0] != KJ[2] * KJ[2] * r % ec.p:
-        raise BTClibRuntimeError("signature verification failed")
-
 
 def assert_as_valid_(
     msg_hash: Octets, Q: BIP340PubKey, sig: Union[Sig, Octets], hf: HashF = sha256
@@ -427,7 +432,7 @@ def _recover_pub_key_(c: int, r: int, s: int, ec: Curve) -> int:
     KJ = r, ec.y_even(r), 1
 
     e1 = mod_inv(c, ec.n)
-    QJ = _double_mult(ec.n - e1, KJ, e1 * s, ec.GJ, ec)
+    QJ = _double_mult_cached(e1 * s % ec.n, ec.GJ, ec.n - e1, KJ, ec)
     # edge case that cannot be reproduced in the test suite
     if QJ[2] == 0:
         err_msg = "invalid (INF) key"  # pragma: no cover
@@ -515,6 +520,7 @@ def assert_batch_as_valid_(
     ec = sigs[0].ec
     if any(sig.ec != ec for sig in sigs):
         raise BTClibValueError("not the same curve for all signatures")
+    max_rand = min(ec.n, 1 << 128) - 1
     t = 0
     scalars: List[int] = []
     points: List[JacPoint] = []
@@ -528,19 +534,22 @@ def assert_batch_as_valid_(
 
         c = challenge_(msg_hash, x_Q, sig.r, ec, hf)
 
-        # rand in [1, n-1]
+        # rand in [1, min(n, 2^128)-1]
         # deterministically generated using a CSPRNG seeded by a
         # cryptographic hash (e.g., SHA256) of all inputs of the
         # algorithm, or randomly generated independently for each
-        # run of the batch verification algorithm
-        rand = 1 if i == 0 else 1 + secrets.randbelow(ec.n - 1)
+        # run of the batch verification algorithm;
+        # 128-bit randomizers are enough for 128-bit security
+        # and halve the bit length of the K multipliers
+        rand = 1 if i == 0 else 1 + secrets.randbelow(max_rand)
         scalars.append(rand)
         points.append(KJ)
         scalars.append(rand * c % ec.n)
         points.append(QJ)
         t += rand * sig.s
 
-    TJ = _mult(t, ec.GJ, ec)
+    # t is not reduced mod n: it is a sum of rand * s terms
+    TJ = mult_fixed_window_cached(t % ec.n, ec.GJ, ec)
     RHSJ = _multi_mult(scalars, points, ec)
 
     # return T == RHS, checked in Jacobian coordinates
@@ -12,8 +12,9 @@
 
 """
 
+import functools
 import hashlib
-from typing import Optional, Tuple
+from typing import Any, Optional, Tuple
 
 from btclib.alias import HashF, Octets
 from btclib.ecc.curve import Curve, secp256k1
@@ -79,7 +80,9 @@ def challenge_(
     return c
 
 
-def tagged_hash(tag: bytes, m: bytes, hf: HashF = hashlib.sha256) -> bytes:
+@functools.lru_cache()
+def _tagged_hash_midstate(tag: bytes, hf: HashF) -> Any:
+    "Return the hf state after hashing hf(tag) + hf(tag); it must not be updated."
 
     h1 = hf()
     h1.update(tag)
@@ -87,8 +90,12 @@ def tagged_hash(tag: bytes, m: bytes, hf: HashF = hashlib.sha256) -> bytes:
 
     h2 = hf()
     h2.update(tag_hash + tag_hash)
+    return h2
+
 
-    # it could be sped up by storing the above midstate
+def tagged_hash(tag: bytes, m: bytes, hf: HashF = hashlib.sha256) -> bytes:
 
+    # copy the cached midstate, avoiding to rehash the tag
+    h2 = _tagged_hash_midstate(tag, hf).copy()
     h2.update(m)
     return h2.digest()
@@ -12,13 +12,25 @@
 
 
 import json
+import operator
 from dataclasses import dataclass
 from os import path
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from btclib.alias import Octets
 from btclib.ecc.curve import CURVES, Curve
-from btclib.exceptions import BTClibValueError
+from btclib.exceptions import BTClibTypeError, BTClibValueError
 from btclib.utils import bytes_from_octets
 
 _KEY_SIZE: List[Tuple[str, int]] = [
@@ -38,6 +50,10 @@ _KEY_SIZE: List[Tuple[str, int]] = [
     ("slip132_p2wsh_p2sh_prv", 4),
     ("slip132_p2wsh_p2sh_pub", 4),
 ]
+_KEYS = tuple(key for key, _ in _KEY_SIZE)
+_SIZES = tuple(size for _, size in _KEY_SIZE)
+# a single C-level call fetching all the _KEYS values
+_GET_KEYS = operator.attrgetter(*_KEYS)
 
 _Network = TypeVar("_Network", bound="Network")
 
@@ -202,7 +218,12 @@ class Network:
 
         # no check on self.curve
 
-        str(self.hrp)
+        if not isinstance(self.hrp, str):
+            raise BTClibTypeError(f"invalid hrp type: {type(self.hrp).__name__}")
+
+        # happy path: a single tuple comparison
+        if tuple(map(len, _GET_KEYS(self))) == _SIZES:
+            return
 
         for key, size in _KEY_SIZE:
             value = bytes(getattr(self, key))
@@ -218,7 +239,26 @@ datadir = path.join(path.dirname(__file__), "_data")
 for net in ("mainnet", "testnet", "regtest"):
     filename = path.join(datadir, net + ".json")
     with open(filename, "r") as f:
-        NETWORKS[net] = Network.from_dict(json.load(f))
+        # bundled data, validated by the test suite
+        NETWORKS[net] = Network.from_dict(json.load(f), check_validity=False)
+
+
+def _first_network_from_value(pairs: Iterable[Tuple[Any, str]]) -> Dict[Any, str]:
+    "Map each value of the (value, network) pairs to its first network."
+
+    network_from_value: Dict[Any, str] = {}
+    for value, network in pairs:
+        network_from_value.setdefault(value, network)
+    return network_from_value
+
+
+# the first network wins: 'regtest' shares most 'testnet' values
+_NETWORK_FROM_KEY_VALUE: Dict[str, Dict[Any, str]] = {
+    key: _first_network_from_value(
+        (getattr(network, key), name) for name, network in NETWORKS.items()
+    )
+    for key in ("curve", "hrp") + _KEYS
+}
 
 
 def network_from_key_value(key: str, prefix: Union[str, bytes, Curve]) -> Optional[str]:
@@ -229,32 +269,47 @@ def network_from_key_value(key: str, prefix: Union[str, bytes, Curve]) -> Option
     WIF/Base58Address/BIP32xkey
     because the two networks share the same prefixes.
     """
+    if key in _NETWORK_FROM_KEY_VALUE:
+        try:
+            # all the hashable values are in the table: a miss is final
+            return _NETWORK_FROM_KEY_VALUE[key].get(prefix)
+        except TypeError:
+            pass  # unhashable value (e.g. bytearray)
+    # fall back to equality: an unknown key raises AttributeError
     for network in NETWORKS:
         if getattr(NETWORKS[network], key) == prefix:
             return network
     return None
 
 
+_XPUB_VERSIONS_BY_NETWORK: Dict[str, Tuple[bytes, ...]] = {
+    net: (
+        NETWORKS[net].bip32_pub,
+        NETWORKS[net].slip132_p2wsh_p2sh_pub,
+        NETWORKS[net].slip132_p2wpkh_p2sh_pub,
+        NETWORKS[net].slip132_p2wpkh_pub,
+        NETWORKS[net].slip132_p2wsh_pub,
+    )
+    for net in NETWORKS
+}
+_XPRV_VERSIONS_BY_NETWORK: Dict[str, Tuple[bytes, ...]] = {
+    net: (
+        NETWORKS[net].bip32_prv,
+        NETWORKS[net].slip132_p2wsh_p2sh_prv,
+        NETWORKS[net].slip132_p2wpkh_p2sh_prv,
+        NETWORKS[net].slip132_p2wpkh_prv,
+        NETWORKS[net].slip132_p2wsh_prv,
+    )
+    for net in NETWORKS
+}
+
+
 def xpubversions_from_network(network: str = "mainnet") -> List[bytes]:
-    network = network.strip().lower()
-    return [
-        NETWORKS[network].bip32_pub,
-        NETWORKS[network].slip132_p2wsh_p2sh_pub,
-        NETWORKS[network].slip132_p2wpkh_p2sh_pub,
-        NETWORKS[network].slip132_p2wpkh_pub,
-        NETWORKS[network].slip132_p2wsh_pub,
-    ]
+    return list(_XPUB_VERSIONS_BY_NETWORK[network.strip().lower()])
 
 
 def xprvversions_from_network(network: str = "mainnet") -> List[bytes]:
-    network = network.strip().lower()
-    return [
-        NETWORKS[network].bip32_prv,
-        NETWORKS[network].slip132_p2wsh_p2sh_prv,
-        NETWORKS[network].slip132_p2wpkh_p2sh_prv,
-        NETWORKS[network].slip132_p2wpkh_prv,
-        NETWORKS[network].slip132_p2wsh_prv,
-    ]
+    return list(_XPRV_VERSIONS_BY_NETWORK[network.strip().lower()])
 
 
 XPRV_VERSIONS_ALL = (
@@ -272,6 +327,12 @@ _REPEATED_NETWORKS = (
 )
 
 
+# the first network wins: 'regtest' shares the 'testnet' versions
+_XKEYVERSION_NETWORKS: Dict[bytes, str] = _first_network_from_value(
+    zip(XPRV_VERSIONS_ALL + XPUB_VERSIONS_ALL, _REPEATED_NETWORKS * 2)
+)
+
+
 def network_from_xkeyversion(xkeyversion: bytes) -> str:
     """Return network string from the xkey version prefix.
 
@@ -280,11 +341,10 @@ def network_from_xkeyversion(xkeyversion: bytes) -> str:
     because the two networks share the same prefixes.
     """
     try:
-        index = XPRV_VERSIONS_ALL.index(xkeyversion)
-    except ValueError:
-        index = XPUB_VERSIONS_ALL.index(xkeyversion)
-
-    return _REPEATED_NETWORKS[index]
+        return _XKEYVERSION_NETWORKS[xkeyversion]
+    except KeyError as e:
+        err_msg = f"unknown extended key version: 0x{bytes(xkeyversion).hex()}"
+        raise BTClibValueError(err_msg) from e
 
 
 def curve_from_xkeyversion(xkeyversion: bytes) -> Curve:
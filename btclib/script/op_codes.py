@@ -13,8 +13,6 @@
 https://en.bitcoin.it/wiki/Script
 """
 
-from typing import List
-
 from btclib.alias import Octets
 from btclib.exceptions import BTClibValueError
 from btclib.utils import bytes_from_octets
@@ -240,24 +238,23 @@ def op_pushdata(data: Octets) -> bytes:
     """
 
     data = bytes_from_octets(data)
-    out: List[bytes] = []
     length = len(data)
     if length < 76:  # 1-byte-length
-        out.append(length.to_bytes(1, byteorder="little", signed=False))
+        prefix = length.to_bytes(1, byteorder="little", signed=False)
     elif length < 256:  # OP_PUSHDATA1 | 1-byte-length
-        out.append(OP_CODES["OP_PUSHDATA1"])
-        out.append(length.to_bytes(1, byteorder="little", signed=False))
+        prefix = OP_CODES["OP_PUSHDATA1"]
+        prefix += length.to_bytes(1, byteorder="little", signed=False)
     elif length < 521:  # OP_PUSHDATA2 | 2-byte-length
-        out.append(OP_CODES["OP_PUSHDATA2"])
-        out.append(length.to_bytes(2, byteorder="little", signed=False))
+        prefix = OP_CODES["OP_PUSHDATA2"]
+        prefix += length.to_bytes(2, byteorder="little", signed=False)
     else:
         # because of the 520 bytes limit
         # there is no need to use OP_PUSHDATA4
-        # out.append(OP_CODES['OP_PUSHDATA4'])
-        # out.append(length.to_bytes(4, byteorder="little", signed=False))
+        # prefix = OP_CODES['OP_PUSHDATA4']
+        # prefix += length.to_bytes(4, byteorder="little", signed=False)
         raise BTClibValueError(f"too many bytes for OP_PUSHDATA: {length}")
-    out.append(data)
-    return b"".join(out)
+    # a single concatenation: no intermediate list
+    return prefix + data
 
 
 def decode_num(data: bytes) -> int:
@@ -10,16 +10,16 @@
 
 "Functions for conversions between different private key formats."
 
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 from btclib.alias import String, Union
-from btclib.base58 import b58decode
+from btclib.base58 import _b58encode_from_int, b58decode
 from btclib.bip32.bip32 import BIP32Key, BIP32KeyData
 from btclib.ecc.curve import Curve, secp256k1
 from btclib.exceptions import BTClibValueError
 from btclib.network import (
     NETWORKS,
-    network_from_key_value,
+    _first_network_from_value,
     network_from_xkeyversion,
     xprvversions_from_network,
 )
@@ -34,6 +34,20 @@ from btclib.utils import bytes_from_octets
 # network and (un)compressed-pub_key-derivation
 PrvKey = Union[int, bytes, str, BIP32KeyData]
 
+# wif prefix byte -> network
+_WIF_PREFIXES: Dict[int, str] = _first_network_from_value(
+    (network.wif[0], name) for name, network in NETWORKS.items()
+)
+
+# allowed base58 sizes of a WIF:
+# the payload (prefix, private key, optional trailing 0x01, 4-bytes checksum)
+# starts with a non-zero prefix byte, i.e. there are no leading '1's
+_WIF_N_SIZES = [network.curve.n_size for network in NETWORKS.values()]
+_WIF_B58_SIZES = range(
+    len(_b58encode_from_int(256 ** (min(_WIF_N_SIZES) + 1 + 4 - 1))),
+    len(_b58encode_from_int(256 ** (max(_WIF_N_SIZES) + 2 + 4) - 1)) + 1,
+)
+
 
 def int_from_prv_key(prv_key: PrvKey, ec: Curve = secp256k1) -> int:
     """Return a verified-as-valid private key integer.
@@ -99,9 +113,14 @@ def _prv_keyinfo_from_wif(
     if isinstance(wif, str):
         wif = wif.strip()
 
+    # reject before the (quadratic) base58 decoding,
+    # e.g. BIP32 extended keys passed to _prv_keyinfo_from_xprvwif
+    if len(wif) not in _WIF_B58_SIZES:
+        raise BTClibValueError(f"invalid WIF size: {len(wif)}")
+
     payload = b58decode(wif)
 
-    net = network_from_key_value("wif", payload[:1])
+    net = _WIF_PREFIXES.get(payload[0]) if payload else None
     if net is None:
         raise BTClibValueError(f"invalid wif prefix: {payload[:1]!r}")
     if network is not None and net != network:
@@ -14,10 +14,11 @@ Dataclass encapsulating
 version, previous block hash, merkle root, time, bits, and nonce.
 """
 
+import struct
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Mapping, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, List, Mapping, Tuple, Type, TypeVar, Union
 
 from btclib.alias import BinaryData, Octets
 from btclib.exceptions import BTClibValueError
@@ -38,6 +39,8 @@ _KEY_SIZE: List[Tuple[str, int]] = [
     ("merkle_root", 32),
     ("bits", 4),
 ]
+# version, previous_block_hash, merkle_root, time, bits, nonce
+_HEADER_STRUCT = struct.Struct("<i32s32sI4sI")
 
 
 @dataclass
@@ -55,6 +58,17 @@ class BlockHeader:
     # 4 bytes, unsigned little endian
     nonce: int
 
+    def _cached(self, name: str, key: bytes, func: Callable[[], Any]) -> Any:
+        "Return func(), cached in the instance __dict__ along with its input key."
+
+        # not a dataclass field: no effect on __eq__ and __repr__;
+        # the cache is keyed on the input, not invalidated on assignment
+        cache = self.__dict__.get(name)
+        if cache is None or cache[0] != key:
+            cache = (key, func())
+            self.__dict__[name] = cache
+        return cache[1]
+
     @property
     def target(self) -> bytes:
         """Return the BlockHeader proof-of-work target.
@@ -62,6 +76,9 @@ class BlockHeader:
         The target aabbcc * 256^dd is represented
         in scientific notation by the 4 bytes bits 0xaabbccdd
         """
+        return self._cached("_target_cache", self.bits, self._target)
+
+    def _target(self) -> bytes:
         # significand (also known as mantissa or coefficient)
         significand = int.from_bytes(self.bits[1:], byteorder="big", signed=False)
         # power term, also called characteristics
@@ -82,6 +99,9 @@ class BlockHeader:
         The difficulty of the genesis block is 2^32 (4*2^30),
         i.e. 4 GigaHash function evaluations.
         """
+        return self._cached("_difficulty_cache", self.bits, self._difficulty)
+
+    def _difficulty(self) -> float:
         # genesis block target
         genesis_significand = 0x00FFFF
         genesis_exponent = 0x1D
@@ -97,8 +117,7 @@ class BlockHeader:
     def hash(self) -> bytes:
         "Return the reversed hash of the BlockHeader."
         s = self.serialize(check_validity=False)
-        hash_ = _HF(s)
-        return hash_[::-1]
+        return self._cached("_hash_cache", s, lambda: _HF(s)[::-1])
 
     def __init__(
         self,
@@ -156,9 +175,13 @@ class BlockHeader:
     def assert_valid_pow(self) -> None:
         "Assert whether the BlockHeader provides a valid proof-of-work."
 
-        if self.hash >= self.target:
-            err_msg = f"invalid proof-of-work: {self.hash.hex()}"
-            err_msg += f" >= {self.target.hex()}"
+        # computed without caching: validation, e.g. in parse,
+        # must not pay for cache bookkeeping
+        hash_ = _HF(self.serialize(check_validity=False))[::-1]
+        target = self._target()
+        if hash_ >= target:
+            err_msg = f"invalid proof-of-work: {hash_.hex()}"
+            err_msg += f" >= {target.hex()}"
             raise BTClibValueError(err_msg)
 
     def assert_valid(self) -> None:
@@ -194,15 +217,13 @@ class BlockHeader:
         if check_validity:
             self.assert_valid()
 
-        return b"".join(
-            [
-                self.version.to_bytes(4, byteorder="little", signed=True),  # int32_t
-                self.previous_block_hash[::-1],
-                self.merkle_root[::-1],
-                int(self.time.timestamp()).to_bytes(4, "little", signed=False),
-                self.bits[::-1],
-                self.nonce.to_bytes(4, byteorder="little", signed=False),
-            ]
+        return _HEADER_STRUCT.pack(
+            self.version,
+            self.previous_block_hash[::-1],
+            self.merkle_root[::-1],
+            int(self.time.timestamp()),
+            self.bits[::-1],
+            self.nonce,
         )
 
     @classmethod
@@ -24,7 +24,7 @@ from btclib.exceptions import BTClibValueError
 from btclib.script.script import decode_num
 from btclib.tx.block_header import BlockHeader
 from btclib.tx.tx import Tx
-from btclib.utils import bytesio_from_binarydata, hash256, merkle_root
+from btclib.utils import bytesio_from_binarydata, hash256, merkle_root_from_hashes
 
 # python 3.6
 if sys.version_info.minor == 6:  # pragma: no cover
@@ -33,6 +33,7 @@ if sys.version_info.minor == 6:  # pragma: no cover
     backports.datetime_fromisoformat.MonkeyPatch.patch_fromisoformat()
 
 _HF = hash256
+_HF_LEN = 32  # hash256 digest size
 
 _Block = TypeVar("_Block", bound="Block")
 
@@ -117,11 +118,15 @@ class Block:
         return any(tx.is_segwit() for tx in self.transactions)
 
     def assert_valid_merkle_root(self) -> None:
-        data = [
-            tx.serialize(include_witness=False, check_validity=False)
-            for tx in self.transactions
-        ]
-        merkle_root_ = merkle_root(data, _HF)[::-1]
+        # the transaction ids (in internal byte order)
+        # are packed in a single buffer as bottom level of the tree
+        hashes = b"".join(
+            [
+                _HF(tx.serialize(include_witness=False, check_validity=False))
+                for tx in self.transactions
+            ]
+        )
+        merkle_root_ = merkle_root_from_hashes(hashes, _HF, _HF_LEN)[::-1]
         if merkle_root_ != self.header.merkle_root:
             err_msg = f"invalid merkle root: {self.header.merkle_root.hex()}"
             err_msg += f" instead of: {merkle_root_.hex()}"
@@ -38,8 +38,9 @@ def sha256(octets: Octets) -> bytes:
 def hash160(octets: Octets) -> bytes:
     "Return the HASH160=RIPEMD160(SHA256) of the input octet sequence."
 
-    t = sha256(octets)
-    return hashlib.new("ripemd160", t).digest()
+    octets = bytes_from_octets(octets)
+    # single expression: no intermediate sha256 wrapper call
+    return hashlib.new("ripemd160", hashlib.sha256(octets).digest()).digest()
 
 
 def hash256(octets: Octets) -> bytes:
@@ -59,16 +60,44 @@ def merkle_root(data: List[bytes], hf: Callable[[Union[bytes, str]], bytes]) ->
     until a single value (root) is obtained.
     """
 
-    data = [hf(item) for item in data]
-    while len(data) != 1:
-        parent_level = []
-        if len(data) % 2:
-            data.append(data[-1])
-        for i in range(0, len(data), 2):
-            parent = hf(data[i] + data[i + 1])
-            parent_level.append(parent)
-        data = parent_level[:]
-    return data[0]
+    hashes = b"".join([hf(item) for item in data])
+    return merkle_root_from_hashes(hashes, hf, len(hashes) // len(data))
+
+
+def merkle_root_from_hashes(
+    hashes: bytes, hf: Callable[[Union[bytes, str]], bytes], size: int = 32
+) -> bytes:
+    """Return the Merkel tree root of a bottom level of hashes.
+
+    The bottom level is provided as a single buffer
+    of concatenated size-bytes hashes.
+    """
+
+    # each level is a single contiguous buffer of concatenated hashes:
+    # pairs are just slices, no per-pair concatenation or list copy
+    step = 2 * size
+    if hf is hash256:
+        # most common case (bitcoin blocks): the slices are bytes already,
+        # so skip the Octets conversion and call hashlib directly
+        sha256_ = hashlib.sha256
+        while len(hashes) != size:
+            if len(hashes) % step:
+                hashes += hashes[-size:]
+            hashes = b"".join(
+                [
+                    sha256_(sha256_(hashes[i : i + step]).digest()).digest()
+                    for i in range(0, len(hashes), step)
+                ]
+            )
+        return hashes
+
+    while len(hashes) != size:
+        if len(hashes) % step:
+            hashes += hashes[-size:]
+        hashes = b"".join(
+            [hf(hashes[i : i + step]) for i in range(0, len(hashes), step)]
+        )
+    return hashes
 
 
 NoneOneOrMoreInt = Optional[Union[int, Iterable[int]]]
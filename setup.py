@@ -33,7 +33,6 @@ setup(
     install_requires=[
         "backports-datetime-fromisoformat>=1.0.0; python_version<'3.7'",
         "dataclasses>=0.8; python_version<'3.7'",
-        "dataclasses_json",
     ],
     keywords=(
         "bitcoin cryptography elliptic-curves ecdsa schnorr RFC-6979 "
@@ -21,6 +21,9 @@ from btclib.b58 import p2pkh  # FIXME why it is needed here
 from btclib.bip32.bip32 import (
     BIP32KeyData,
     _derive,
+    _derive_pub_prefix,
+    _ExtendedBIP32KeyData,
+    clear_derive_cache,
     crack_prv_key,
     derive,
     derive_from_account,
@@ -28,6 +31,7 @@ from btclib.bip32.bip32 import (
     xpub_from_xprv,
 )
 from btclib.bip32.der_path import _indexes_from_bip32_path_str
+from btclib.ecc.sec_point import point_from_octets
 from btclib.exceptions import BTClibValueError
 
 
@@ -214,6 +218,42 @@ def test_derive() -> None:
         assert derive(rootxprv, "m") == rootxprv
 
 
+def test_derive_cache() -> None:
+    rootxprv = "xprv9s21ZrQH143K2ZP8tyNiUtgoezZosUkw9hhir2JFzDhcUWKz8qFYk3cxdgSFoCMzt8E2Ubi1nXw71TLhwgCfzqFHfM5Snv4zboSebePRmLS"
+    der_path = "m/44h/0h/0h/0/1"
+
+    # private derivations are never cached
+    clear_derive_cache()
+    expected = derive(rootxprv, der_path)
+    assert _derive_pub_prefix.cache_info().currsize == 0
+
+    xpub = xpub_from_xprv(derive(rootxprv, "m/44h/0h/0h"))
+    xkey = _derive(xpub, "m/0/1")
+    assert xkey.b58encode() == xpub_from_xprv(expected)
+    assert _derive_pub_prefix.cache_info().currsize == 1
+    # returned keys must not alias the cached intermediate results
+    xkey.chain_code = b"\x00" * 32
+    xkey2 = _derive(xpub, "m/0/1")
+    assert xkey2.chain_code != xkey.chain_code
+    assert _derive(xpub, "m/0") != _derive(xpub, "m/0/1")
+
+    clear_derive_cache()
+    assert derive(xpub, "m/0/1") == xpub_from_xprv(expected)
+
+    # the lazily computed public key point is not a dataclass field
+    xkey_bin = BIP32KeyData.b58decode(xpub).serialize()
+    xkey = _ExtendedBIP32KeyData.parse(xkey_bin)
+    xkey2 = _ExtendedBIP32KeyData.parse(xkey_bin)
+    assert xkey.pub_key_point == point_from_octets(xkey.key)
+    assert xkey == xkey2
+    assert repr(xkey) == repr(xkey2)
+
+    # decoded keys are not shared either
+    xkey = BIP32KeyData.b58decode(rootxprv)
+    xkey.depth = 1
+    assert BIP32KeyData.b58decode(rootxprv).depth == 0
+
+
 def test_derive_exceptions() -> None:
     # root key, zero depth
     rootmxprv = "xprv9s21ZrQH143K3QTDL4LXw2F7HEK3wJUD2nW2nRk4stbPy6cq3jPPqjiChkVvvNKmPGJxWUtg6LnF5kejMRNNU3TGtRBeJgk33yuGBxrMPHi"
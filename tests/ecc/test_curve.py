@@ -17,7 +17,7 @@ import pytest
 
 from btclib.alias import INF, INFJ
 from btclib.ecc.curve import CURVES, Curve, double_mult, mult, multi_mult, secp256k1
-from btclib.ecc.curve_group import jac_from_aff
+from btclib.ecc.curve_group import _mult, jac_from_aff
 from btclib.ecc.number_theory import mod_sqrt
 from btclib.ecc.pedersen import second_generator
 from btclib.exceptions import BTClibTypeError, BTClibValueError
@@ -310,6 +310,29 @@ def test_symmetry() -> None:
         secp256k1.y_quadratic_residue(INF[0])
 
 
+def test_mult_generator() -> None:
+    for ec in low_card_curves.values():
+        for q in range(ec.n + 1):
+            # the generator is multiplied using its cached multiples
+            Q = ec.aff_from_jac(_mult(q % ec.n, ec.GJ, ec))
+            assert mult(q, None, ec) == Q
+            assert mult(q, ec.G, ec) == Q
+    ec = secp256k1
+    for q in (1, ec.n - 1, 1 + secrets.randbelow(ec.n - 1)):
+        Q = ec.aff_from_jac(_mult(q, ec.GJ, ec))
+        assert mult(q) == Q
+        assert mult(q, ec.G) == Q
+
+
+def test_mult_secp256k1() -> None:
+    ec = secp256k1
+    # variable-base multiplication uses the GLV endomorphism
+    for Q in (INF, mult(2), mult(1 + secrets.randbelow(ec.n - 1))):
+        QJ = jac_from_aff(Q)
+        for q in (0, 1, 2, ec.n - 1, ec.n, 1 + secrets.randbelow(ec.n - 1)):
+            assert mult(q, Q) == ec.aff_from_jac(_mult(q % ec.n, QJ, ec))
+
+
 @pytest.mark.fifth
 def test_assorted_mult() -> None:
     ec = ec23_31
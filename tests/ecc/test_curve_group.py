@@ -19,6 +19,7 @@ from btclib.ecc.curve import secp256k1
 from btclib.ecc.curve_group import (
     MAX_W,
     _double_mult,
+    _double_mult_cached,
     _mult,
     _multi_mult,
     cached_multiples,
@@ -370,6 +371,7 @@ def test_assorted_jac_mult() -> None:
             assert ec.is_on_curve(ec.aff_from_jac(shamir))
             K1JK2J = ec.add_jac(K1J, K2J)
             assert ec.jac_equality(K1JK2J, shamir)
+            assert ec.jac_equality(K1JK2J, _double_mult_cached(k1, ec.GJ, k2, HJ, ec))
 
             k3 = 1 + secrets.randbelow(ec.n - 1)
             K3J = _mult(k3, ec.GJ, ec)
@@ -9,6 +9,8 @@
 
 "Tests for the `btclib.curve_group_2` module."
 
+import secrets
+
 import pytest
 
 from btclib.alias import INFJ
@@ -18,6 +20,7 @@ from btclib.ecc.curve_group_2 import (
     mult_endomorphism_secp256k1,
     mult_sliding_window,
     mult_w_NAF,
+    multiplier_decomposer,
 )
 from btclib.exceptions import BTClibValueError
 from tests.ecc.test_curve import low_card_curves
@@ -109,3 +112,14 @@ def test_mult_endomorphism_secp256k1() -> None:
 
     with pytest.raises(ValueError, match="negative m: "):
         mult_endomorphism_secp256k1(-1, ec.GJ, ec)
+
+    lam = 0x5363AD4CC05C30E0A5261C028812645A122E22EA20816678DF02967C1B23BD72
+    QJ = _mult(1 + secrets.randbelow(ec.n - 1), ec.GJ, ec)
+    for _ in range(8):
+        m = secrets.randbelow(ec.n)
+        m1, m2 = multiplier_decomposer(m, ec)
+        assert (m1 + m2 * lam - m) % ec.n == 0
+        # half-length multipliers
+        assert abs(m1).bit_length() <= 129
+        assert abs(m2).bit_length() <= 129
+        assert ec.jac_equality(mult_endomorphism_secp256k1(m, QJ, ec), _mult(m, QJ, ec))
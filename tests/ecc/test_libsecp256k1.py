@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Copyright (C) 2017-2021 The btclib developers
+#
+# This file is part of btclib. It is subject to the license terms in the
+# LICENSE file found in the top-level directory of this distribution.
+#
+# No part of btclib including this file, may be copied, modified, propagated,
+# or distributed except according to the terms contained in the LICENSE file.
+
+"Tests for the `btclib.libsecp256k1` module."
+
+import secrets
+from hashlib import sha256
+from typing import Any
+
+import pytest
+
+from btclib.ecc import dsa
+from btclib.ecc.curve import mult, secp256k1
+from btclib.ecc.libsecp256k1 import (
+    LIBSECP256K1_AVAILABLE,
+    ecdsa_sign_,
+    pub_key_from_prv_key,
+    rfc6979_,
+)
+from btclib.ecc.rfc6979 import _rfc6979_
+from btclib.ecc.sec_point import bytes_from_point
+from btclib.exceptions import BTClibValueError
+
+ec = secp256k1
+
+
+def _hf(*args: bytes) -> Any:
+    "Not sha256 itself, to force the pure python implementations."
+    return sha256(*args)
+
+
+@pytest.mark.skipif(not LIBSECP256K1_AVAILABLE, reason="requires coincurve")
+def test_pub_key_from_prv_key() -> None:
+
+    for q in (1, 2, ec.n - 1, 1 + secrets.randbelow(ec.n - 1)):
+        Q = mult(q)
+        assert pub_key_from_prv_key(q) == bytes_from_point(Q)
+        assert pub_key_from_prv_key(q, False) == bytes_from_point(Q, ec, False)
+
+    for q in (0, ec.n, -1, 2 ** 256):
+        with pytest.raises(BTClibValueError, match="private key not in 1..n-1: "):
+            pub_key_from_prv_key(q)
+
+
+@pytest.mark.skipif(not LIBSECP256K1_AVAILABLE, reason="requires coincurve")
+def test_ecdsa_sign_() -> None:
+
+    msg_hashes = (b"\x00" * 32, b"\xff" * 32, secrets.token_bytes(32))
+    for q in (1, 2, ec.n - 1, 1 + secrets.randbelow(ec.n - 1)):
+        for msg_hash in msg_hashes:
+            # pure python signature, with explicit RFC6979 nonce
+            nonce = _rfc6979_(int.from_bytes(msg_hash, "big") % ec.n, q, ec, _hf)
+            sig = dsa.sign_(msg_hash, q, nonce)
+            assert ecdsa_sign_(msg_hash, q) == (sig.r, sig.s)
+            assert dsa.sign_(msg_hash, q) == sig
+
+    for q in (0, ec.n, -1, 2 ** 256):
+        with pytest.raises(BTClibValueError, match="private key not in 1..n-1: "):
+            ecdsa_sign_(msg_hashes[2], q)
+
+
+@pytest.mark.skipif(not LIBSECP256K1_AVAILABLE, reason="requires coincurve")
+def test_rfc6979_() -> None:
+
+    for q in (1, 2, ec.n - 1, 1 + secrets.randbelow(ec.n - 1)):
+        for c in (0, 1, ec.n - 1, secrets.randbelow(ec.n)):
+            assert rfc6979_(c, q) == _rfc6979_(c, q, ec, _hf)
+            assert rfc6979_(c, q) == _rfc6979_(c, q, ec, sha256)
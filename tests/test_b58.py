@@ -22,7 +22,7 @@ from btclib.ecc.sec_point import bytes_from_point, point_from_octets
 from btclib.exceptions import BTClibValueError
 from btclib.hashes import hash160_from_key
 from btclib.script.script import Command, serialize
-from btclib.to_prv_key import prv_keyinfo_from_prv_key
+from btclib.to_prv_key import _prv_keyinfo_from_wif, prv_keyinfo_from_prv_key
 from btclib.to_pub_key import pub_keyinfo_from_prv_key
 from btclib.utils import hash160, sha256
 
@@ -82,6 +82,11 @@ def test_wif_from_prv_key() -> None:
     badwif = b58encode(payload)
     with pytest.raises(BTClibValueError, match="not a private key: "):
         prv_keyinfo_from_prv_key(badwif)
+    # rejected by its base58 size, before decoding
+    with pytest.raises(BTClibValueError, match="invalid WIF size: "):
+        _prv_keyinfo_from_wif(badwif)
+    with pytest.raises(BTClibValueError, match="invalid WIF size: "):
+        _prv_keyinfo_from_wif(test_vectors[0][0][:-3])
 
 
 def test_address_from_h160() -> None:
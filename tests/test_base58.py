@@ -69,6 +69,11 @@ def test_exceptions() -> None:
     with pytest.raises(BTClibValueError, match=err_msg):
         b58decode(_b58encode(b"123"))
 
+    err_msg = "Base58 string contains invalid characters"
+    for invalid_char in (b"0", b"O", b"I", b"l", b"+", b"/", b"\xff"):
+        with pytest.raises(BTClibValueError, match=err_msg):
+            b58decode(encoded[:5] + invalid_char + encoded[5:])
+
 
 def test_wif() -> None:
     # https://en.bitcoin.it/wiki/Wallet_import_format
@@ -107,3 +112,10 @@ def test_integers() -> None:
     n = int(number, 16)
     assert _b58decode_to_int(digits) == n
     assert _b58encode_from_int(n) == digits[1:]
+
+    # around the limb boundaries
+    for exp in range(8, 32):
+        for i in (58 ** exp - 1, 58 ** exp, 58 ** exp + 1):
+            encoded = _b58encode_from_int(i)
+            assert _b58decode_to_int(encoded) == i
+            assert len(encoded) == exp + (i >= 58 ** exp)
@@ -10,8 +10,10 @@
 
 "Tests for the `btclib.hashes` module."
 
+import hashlib
+
 from btclib.bip32.bip32 import BIP32KeyData, derive, rootxprv_from_seed
-from btclib.hashes import fingerprint
+from btclib.hashes import fingerprint, tagged_hash
 
 
 def test_fingerprint() -> None:
@@ -22,3 +24,15 @@ def test_fingerprint() -> None:
     child_key = derive(xprv, 0x80000000)
     pf2 = BIP32KeyData.b58decode(child_key).parent_fingerprint
     assert pf == pf2
+
+
+def test_tagged_hash() -> None:
+
+    for hf in (hashlib.sha256, hashlib.sha512):
+        for tag in (b"BIP0340/challenge", b"TapLeaf"):
+            tag_hash = hf(tag).digest()
+            for m in (b"", b"a", b"a" * 100):
+                expected = hf(tag_hash + tag_hash + m).digest()
+                # the cached midstate must not be altered by previous calls
+                assert tagged_hash(tag, m, hf) == expected
+                assert tagged_hash(tag, m, hf) == expected
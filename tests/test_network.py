@@ -16,11 +16,12 @@ from os import path
 import pytest
 
 from btclib.ecc.curve import CURVES
-from btclib.exceptions import BTClibValueError
+from btclib.exceptions import BTClibTypeError, BTClibValueError
 from btclib.network import (
     NETWORKS,
     Network,
     curve_from_xkeyversion,
+    network_from_key_value,
     network_from_xkeyversion,
     xprvversions_from_network,
     xpubversions_from_network,
@@ -50,6 +51,11 @@ def test_bad_network() -> None:
             slip132_p2wsh_p2sh_pub="0295b43f",
         )
 
+    dict_ = NETWORKS["mainnet"].to_dict()
+    dict_["hrp"] = b"bc"  # type: ignore
+    with pytest.raises(BTClibTypeError, match="invalid hrp type: "):
+        Network.from_dict(dict_)
+
 
 def test_curve_from_xkeyversion() -> None:
     for net in NETWORKS:
@@ -60,6 +66,21 @@ def test_curve_from_xkeyversion() -> None:
                 assert net == network_from_xkeyversion(version)
             assert NETWORKS[net].curve == curve_from_xkeyversion(version)
 
+    with pytest.raises(BTClibValueError, match="unknown extended key version: "):
+        network_from_xkeyversion(b"\x00" * 4)
+
+
+def test_network_from_key_value() -> None:
+    assert network_from_key_value("hrp", "bc") == "mainnet"
+    # 'regtest' shares the 'testnet' wif prefix
+    assert network_from_key_value("wif", NETWORKS["regtest"].wif) == "testnet"
+    assert network_from_key_value("hrp", "xx") is None
+    # unhashable values fall back to equality
+    assert network_from_key_value("wif", bytearray(b"\x80")) == "mainnet"
+    assert network_from_key_value("wif", bytearray(b"\x81")) is None
+    with pytest.raises(AttributeError):
+        network_from_key_value("unknown_key", "bc")
+
 
 def test_space_and_caps() -> None:
     net = " MainNet "
@@ -74,6 +95,12 @@ def test_numbers_of_networks() -> None:
     assert len(NETWORKS) == 3
 
 
+def test_bundled_networks() -> None:
+    # bundled networks are not validated at import time
+    for net in NETWORKS.values():
+        net.assert_valid()
+
+
 def test_dataclasses_json_dict() -> None:
     for network_name, net in NETWORKS.items():
         assert net == Network.from_dict(net.to_dict())
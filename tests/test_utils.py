@@ -18,7 +18,15 @@ import pytest
 
 # Library imports
 from btclib.exceptions import BTClibValueError
-from btclib.utils import hash160, hash256, hex_string, int_from_integer
+from btclib.utils import (
+    hash160,
+    hash256,
+    hex_string,
+    int_from_integer,
+    merkle_root,
+    merkle_root_from_hashes,
+    sha256,
+)
 from tests.test_to_key import (
     net_unaware_compressed_pub_keys,
     net_unaware_uncompressed_pub_keys,
@@ -67,3 +75,27 @@ def test_hex_string() -> None:
     int_ = -1
     with pytest.raises(BTClibValueError, match="negative integer: "):
         hex_string(int_)
+
+
+def test_merkle_root() -> None:
+    data = [secrets.token_bytes(32) for _ in range(5)]
+    h = [hash256(d) for d in data]
+
+    assert merkle_root(data[:1], hash256) == h[0]
+    assert merkle_root(data[:2], hash256) == hash256(h[0] + h[1])
+    # odd number of hashes: the last one is duplicated
+    h01 = hash256(h[0] + h[1])
+    h22 = hash256(h[2] + h[2])
+    assert merkle_root(data[:3], hash256) == hash256(h01 + h22)
+    h23 = hash256(h[2] + h[3])
+    h44 = hash256(h[4] + h[4])
+    h0123 = hash256(h01 + h23)
+    h4444 = hash256(h44 + h44)
+    assert merkle_root(data, hash256) == hash256(h0123 + h4444)
+    assert merkle_root_from_hashes(b"".join(h), hash256) == hash256(h0123 + h4444)
+
+    # generic hash function
+    h = [sha256(d) for d in data[:3]]
+    h01 = sha256(h[0] + h[1])
+    h22 = sha256(h[2] + h[2])
+    assert merkle_root(data[:3], sha256) == sha256(h01 + h22)
@@ -122,6 +122,33 @@ def test_exceptions() -> None:
         header.assert_valid()
 
 
+def test_header_cache() -> None:
+    "Test that cached properties follow field changes"
+
+    fname = "block_1.bin"
+    filename = path.join(path.dirname(__file__), "_data", fname)
+    with open(filename, "rb") as file_:
+        header = BlockHeader.parse(file_.read()[:80])
+
+    hash_ = header.hash
+    target = header.target
+    difficulty = header.difficulty
+    assert header.hash == hash_
+    # the cache is not part of the dataclass fields
+    assert header == BlockHeader.parse(header.serialize())
+    assert "cache" not in repr(header)
+
+    header.nonce += 1
+    assert header.hash != hash_
+    assert header.target == target
+    header.nonce -= 1
+    assert header.hash == hash_
+
+    header.bits = bytes.fromhex("1c00ffff")
+    assert header.target != target
+    assert header.difficulty == difficulty * 256
+
+
 def test_block_170() -> None:
     "Test first block with a transaction"
 